@@ -0,0 +1,48 @@
+import streamlit as st
+
+from stock_index import format_market_cap, load_stock_index
+
+st.set_page_config(page_title="📈 Stock Lookup", layout="wide")
+st.title("📈 Stock Lookup")
+st.write("Search 5,800+ listed companies by ticker symbol or company name. Results come from a prebuilt index, so every keystroke is answered instantly.")
+
+
+# --- LOAD INDEX ---
+# Parse the TSV and build the symbol/name indexes once per server process
+@st.cache_resource
+def get_index():
+    return load_stock_index()
+
+
+index = get_index()
+
+# --- SEARCH ---
+query = st.text_input("🔍 Symbol or company name", placeholder="e.g. AAPL or Apple")
+limit = st.sidebar.slider("Max results", 5, 100, 20)
+
+if query:
+    exact = index.lookup(query)
+    if exact is not None:
+        st.subheader(f"{exact['Symbol']} — {exact['CompanyName']}")
+        col1, col2 = st.columns(2)
+        col1.metric("Market Cap", format_market_cap(exact["MarketCap"]))
+        col2.metric("Industry", exact["Industry"])
+
+    results = index.search(query, limit=limit)
+    if results.empty:
+        st.info(f"No companies found starting with '{query}'.")
+    else:
+        st.write(f"Top {len(results)} matches by market cap:")
+        results["MarketCap"] = results["MarketCap"].map(format_market_cap)
+        st.dataframe(results, use_container_width=True, hide_index=True)
+
+# --- INDUSTRY OVERVIEW ---
+st.subheader("🏭 Market Cap by Industry")
+industry = st.selectbox("Select an industry", list(index.industry_stats.index))
+stats = index.industry_summary(industry)
+col3, col4, col5 = st.columns(3)
+col3.metric("Companies", int(stats["Companies"]))
+col4.metric("Total Market Cap", format_market_cap(stats["TotalCap"]))
+col5.metric("Median Market Cap", format_market_cap(stats["MedianCap"]))
+
+st.bar_chart(index.industry_stats["TotalCap"].head(15) / 1e9, y_label="Total Market Cap ($B)")
@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# --- STOCK LISTINGS INDEX ---
+# Loads stocks-1.tsv once into compact columns and builds the lookup structures
+# the search page needs, so a keystroke is answered from an index instead of a
+# str.contains scan over every company name.
+
+DATA_PATH = Path(__file__).parent.parent / "Course-Materials" / "stocks-1.tsv"
+SUFFIX_MULTIPLIERS = {"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+
+
+# Turn market cap strings like "53.65B" or "2,462.50B" into float64 dollars, without a Python loop
+def parse_market_cap(values):
+    values = pd.Series(values, dtype="string").str.strip().str.upper().str.replace(",", "", regex=False)
+    suffix = values.str[-1]
+    multiplier = suffix.map(SUFFIX_MULTIPLIERS).astype("float64").fillna(1.0)
+    number = pd.to_numeric(values.str.rstrip("".join(SUFFIX_MULTIPLIERS)), errors="coerce")
+    return (number.astype("float64") * multiplier).to_numpy(dtype="float64", na_value=np.nan)
+
+
+class StockIndex:
+    def __init__(self, symbols, names, industries, market_caps):
+        # Columnar storage: plain arrays for text, a categorical for the repeated industry labels
+        self.symbols = np.asarray(symbols, dtype=object)
+        self.names = np.asarray(names, dtype=object)
+        self.industries = pd.Categorical(industries)
+        self.market_caps = np.asarray(market_caps, dtype="float64")
+
+        # Hash index: exact symbol -> row
+        self.symbol_rows = {symbol.upper(): row for row, symbol in enumerate(self.symbols)}
+
+        # Sorted indexes for prefix search on lowercase names and on symbols
+        self._name_keys, self._name_rows = self._sorted_index(np.char.lower(self.names.astype(str)))
+        self._symbol_keys, self._symbol_rows = self._sorted_index(np.char.upper(self.symbols.astype(str)))
+
+        # Per-industry market cap aggregates, computed once
+        caps = pd.DataFrame({"Industry": self.industries, "MarketCap": self.market_caps})
+        self.industry_stats = caps.groupby("Industry", observed=True)["MarketCap"].agg(
+            Companies="count", TotalCap="sum", MeanCap="mean", MedianCap="median", MaxCap="max"
+        ).sort_values("TotalCap", ascending=False)
+
+    @staticmethod
+    def _sorted_index(keys):
+        order = np.argsort(keys, kind="stable")
+        return keys[order], order
+
+    # Rows whose key starts with prefix: a binary search for both ends of the matching range
+    @staticmethod
+    def _prefix_rows(keys, rows, prefix):
+        start = np.searchsorted(keys, prefix, side="left")
+        end = np.searchsorted(keys, prefix + "\uffff", side="left")
+        return rows[start:end]
+
+    def __len__(self):
+        return len(self.symbols)
+
+    # Table view of the given rows
+    def rows(self, rows):
+        rows = np.asarray(rows, dtype=np.intp)
+        return pd.DataFrame({
+            "Symbol": self.symbols[rows],
+            "CompanyName": self.names[rows],
+            "Industry": self.industries[rows],
+            "MarketCap": self.market_caps[rows],
+        })
+
+    # Exact symbol lookup; returns None when the symbol is not listed
+    def lookup(self, symbol):
+        row = self.symbol_rows.get(symbol.strip().upper())
+        return None if row is None else self.rows([row]).iloc[0]
+
+    # Typeahead: symbols or company names starting with query, largest companies first
+    def search(self, query, limit=20):
+        query = query.strip()
+        if not query:
+            return self.rows([])
+        matches = np.union1d(
+            self._prefix_rows(self._symbol_keys, self._symbol_rows, query.upper()),
+            self._prefix_rows(self._name_keys, self._name_rows, query.lower()),
+        )
+        caps = np.nan_to_num(self.market_caps[matches], nan=-1.0)
+        best = matches[np.argsort(-caps, kind="stable")[:limit]]
+        return self.rows(best)
+
+    # Aggregates for a single industry
+    def industry_summary(self, industry):
+        return self.industry_stats.loc[industry]
+
+
+# Read the TSV and build the index
+def load_stock_index(path=DATA_PATH):
+    df = pd.read_csv(path, sep="\t", dtype=str, keep_default_na=False)
+    return StockIndex(df["Symbol"], df["CompanyName"], df["Industry"], parse_market_cap(df["MarketCap"]))
+
+
+# Format a dollar amount back into the short K/M/B/T style
+def format_market_cap(value):
+    if value is None or np.isnan(value):
+        return "n/a"
+    for suffix, multiplier in reversed(SUFFIX_MULTIPLIERS.items()):
+        if abs(value) >= multiplier:
+            return f"${value / multiplier:.2f}{suffix}"
+    return f"${value:,.0f}"
@@ -2,10 +2,14 @@ import streamlit as st
 import pandas as pd
 import requests
 import altair as alt
+import os
 import random
-from datetime import datetime
+import time
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 from PIL import Image
 import streamlit.components.v1 as components
+from profile_store import PROFILE_FIELDS, open_store
 
 # --- PAGE CONFIG ---
 # Set up Streamlit page with title and wide layout
@@ -24,13 +28,58 @@ HEADERS = {
 
 # --- SESSION STATE DEFAULTS ---
 # Initialize all session variables to store user input and logs
-for key in ["gender", "weight", "height", "age", "goal", "activity", "data_rows", "mood_log", "activity_log", "selected_tab"]:
+for key in ["gender", "weight", "height", "age", "goal", "activity", "timezone", "user_id", "data_rows", "mood_log", "activity_log", "selected_tab"]:
     if key not in st.session_state:
         st.session_state[key] = None if key not in ["data_rows", "mood_log", "activity_log"] else []
 
 if st.session_state.selected_tab is None:
     st.session_state.selected_tab = "🏠 Home"
 
+# Time zones users can view their logs in
+TIMEZONES = ["America/New_York", "America/Chicago", "America/Denver", "America/Los_Angeles", "UTC",
+             "Europe/London", "Europe/Paris", "Asia/Seoul", "Asia/Tokyo", "Australia/Sydney"]
+
+
+# --- USER STORE ---
+# One store per server process, shared by every session: SQLite in WAL mode with a pooled connection manager and a profile cache
+@st.cache_resource
+def get_store():
+    return open_store(os.environ.get("THRIVEHUB_DB", "thrivehub.db"))
+
+store = get_store()
+
+# The username is kept in the URL, so a refresh reloads the same profile and logs
+username = st.sidebar.text_input("👤 Username", value=st.query_params.get("user", ""), help="Enter a username to save your profile and logs. Anything you logged before entering one is saved to that username.").strip()
+if username:
+    st.query_params["user"] = username
+elif "user" in st.query_params:
+    del st.query_params["user"]
+
+# Load the stored profile and logs when the user changes
+if username != (st.session_state.user_id or ""):
+    previous_user = st.session_state.user_id
+    st.session_state.user_id = username or None
+    stored_profile = store.load_profile(username) if username else None
+
+    # Use the stored profile if there is one. A guest who signs up keeps the profile they entered;
+    # anyone else switching to a new username (or signing out) starts from the defaults.
+    if stored_profile or previous_user:
+        for field in PROFILE_FIELDS:
+            st.session_state[field] = (stored_profile or {}).get(field)
+
+    if username:
+        # Mood and activity entries logged as a guest are saved to the username rather than dropped
+        if previous_user is None:
+            guest_entries = [("mood", entry) for entry in st.session_state.mood_log] + [("activity", entry) for entry in st.session_state.activity_log]
+            for kind, entry in guest_entries:
+                store.append_log(username, kind, entry)
+            if guest_entries:
+                st.sidebar.success(f"Saved {len(guest_entries)} entries from this session to {username}.")
+        st.session_state.mood_log = store.load_logs(username, "mood")
+        st.session_state.activity_log = store.load_logs(username, "activity")
+    else:
+        st.session_state.mood_log, st.session_state.activity_log = [], []
+
 
 # --- NAVIGATION ---
 # Sidebar tab selection
@@ -48,6 +97,11 @@ with st.sidebar:
     st.session_state.age = st.slider("Age", 12, 80, value=st.session_state.age if st.session_state.age else 25)
     st.session_state.goal = st.selectbox("Goal", ["Maintenance", "Weight Loss", "Muscle Gain"], index=0 if not st.session_state.goal else ["Maintenance", "Weight Loss", "Muscle Gain"].index(st.session_state.goal))
     st.session_state.activity = st.selectbox("Activity Level", ["Sedentary", "Moderate", "Active"], index=0 if not st.session_state.activity else ["Sedentary", "Moderate", "Active"].index(st.session_state.activity))
+    st.session_state.timezone = st.selectbox("Time Zone", TIMEZONES, index=0 if not st.session_state.timezone else TIMEZONES.index(st.session_state.timezone))
+
+# Save the profile for signed-in users; the store skips the write when nothing changed
+if st.session_state.user_id:
+    store.save_profile(st.session_state.user_id, {field: st.session_state[field] for field in PROFILE_FIELDS})
 
 # --- HOME PAGE ---
 if st.session_state.selected_tab == "🏠 Home":
@@ -85,6 +139,20 @@ def estimate_calories(goal, bmr, activity):
     adjustment = {"Weight Loss": -500, "Maintenance": 0, "Muscle Gain": 300}[goal]
     return bmr * factor + adjustment
 
+# Current time as UTC epoch milliseconds; every log stores its timestamp this way
+def now_epoch_ms():
+    return time.time_ns() // 1_000_000
+
+# Look up a time zone once and reuse it on every rerun
+@lru_cache(maxsize=None)
+def get_zone(name):
+    return ZoneInfo(name)
+
+# Convert a column of UTC epoch milliseconds to wall-clock milliseconds in the given zone, in one vectorized step
+def to_local_ms(epoch_ms, zone_name):
+    local = pd.to_datetime(epoch_ms, unit="ms", utc=True).dt.tz_convert(get_zone(zone_name)).dt.tz_localize(None)
+    return pd.Series(local.to_numpy(dtype="datetime64[ms]").astype("int64"), index=epoch_ms.index)
+
 # Make API call to Nutritionix to get nutrition info for a food item
 def get_nutrition_data(food):
     response = requests.post(API_URL, headers=HEADERS, json={"query": food})
@@ -169,7 +237,10 @@ elif st.session_state.selected_tab == "🧘 Mood & Mind":
 
     # Log energy and mood when button is clicked
     if st.button("➕ Log Energy Level"):
-        st.session_state.mood_log.append({"time": datetime.now(), "mood": mood, "energy": energy})
+        entry = {"time": now_epoch_ms(), "mood": mood, "energy": energy}
+        st.session_state.mood_log.append(entry)
+        if st.session_state.user_id:
+            store.append_log(st.session_state.user_id, "mood", entry)
         st.success("Energy level added to your mood log!")
 
     st.markdown("### 🎧 Curated Playlist for You")
@@ -245,14 +316,16 @@ elif st.session_state.selected_tab == "🚶 Fitness Boost":
             duration = calories_to_burn / burn_rate
             calories = burn_rate * duration
 
-            st.session_state.activity_log.append({
-                "date": datetime.now().date(),
-                "time": datetime.now(),
+            entry = {
+                "time": now_epoch_ms(),
                 "energy": energy,
                 "activity": activity_type,
                 "duration": round(duration, 1),
                 "calories": round(calories, 1)
-            })
+            }
+            st.session_state.activity_log.append(entry)
+            if st.session_state.user_id:
+                store.append_log(st.session_state.user_id, "activity", entry)
             st.success(f"✅ Logged {activity_type.lower()} for {duration:.1f} minutes — {calories:.1f} kcal burned!")
         else:
             st.warning("Please enter your weight in the sidebar to calculate activity metrics.")
@@ -260,7 +333,9 @@ elif st.session_state.selected_tab == "🚶 Fitness Boost":
     # --- Display recent activity log ---
     if st.session_state.activity_log:
         st.markdown("### 📘 Recent Activity Log")
-        for entry in reversed(st.session_state.activity_log[-5:]):
+        recent = pd.DataFrame(st.session_state.activity_log[-5:])
+        recent["date"] = pd.to_datetime(to_local_ms(recent["time"], st.session_state.timezone), unit="ms").dt.date
+        for entry in reversed(recent.to_dict("records")):
             st.markdown(f"**📅 {entry['date']}** — ⚡ Energy: {entry['energy']}/100")
 
 # --- LIFESTYLE TRACKER PAGE ---
@@ -269,24 +344,23 @@ elif st.session_state.selected_tab == "📈 Lifestyle Tracker":
     st.caption("View how your mood and energy evolve over time — powered by your own entries.")
 
     # --- Mood & Mind Section ---
-    from pytz import timezone
-
     st.subheader("🧠 Mood & Energy Log")
 
     if st.session_state.mood_log:
         mood_df = pd.DataFrame(st.session_state.mood_log)
-        mood_df["time"] = pd.to_datetime(mood_df["time"])
 
-        # Convert to Eastern Time
-        eastern = timezone("US/Eastern")
-        mood_df["time_est"] = mood_df["time"].dt.tz_localize("UTC").dt.tz_convert(eastern)
+        # Shift the stored UTC epochs to the selected zone; the chart reads these integers on a UTC scale, so it shows local wall-clock time
+        zone_name = st.session_state.timezone
+        mood_df["time_local"] = to_local_ms(mood_df["time"], zone_name)
+        time_axis = alt.X("time_local:T", title=f"Date & Time ({zone_name})", scale=alt.Scale(type="utc"), axis=alt.Axis(format="%b %d %I:%M %p"))
+        time_tooltip = ["mood", "energy", alt.Tooltip("time_local:T", title="time", format="%b %d %I:%M %p", formatType="utc")]
 
         if len(mood_df) == 1:
             # Use a dot chart for single entry
             mood_chart = alt.Chart(mood_df).mark_circle(size=150, color="#8BC34A").encode(
-                x=alt.X("time_est:T", title="Date & Time (EST)", axis=alt.Axis(format="%b %d %I:%M %p")),
+                x=time_axis,
                 y=alt.Y("energy:Q", title="Energy Level"),
-                tooltip=["mood", "energy", "time_est"]
+                tooltip=time_tooltip
             ).properties(height=300, title="Mood-Based Energy Over Time")
         else:
             # Use area chart for multiple entries
@@ -301,9 +375,9 @@ elif st.session_state.selected_tab == "📈 Lifestyle Tracker":
                     x1=1, x2=1, y1=1, y2=0
                 )
             ).encode(
-                x=alt.X("time_est:T", title="Date & Time (EST)", axis=alt.Axis(format="%b %d %I:%M %p")),
+                x=time_axis,
                 y=alt.Y("energy:Q", title="Energy Level"),
-                tooltip=["mood", "energy", "time_est"]
+                tooltip=time_tooltip
             ).properties(height=300, title="Mood-Based Energy Over Time")
 
         st.altair_chart(mood_chart, use_container_width=True)
@@ -313,9 +387,9 @@ elif st.session_state.selected_tab == "📈 Lifestyle Tracker":
     # --- Fitness Boost Section ---
     st.subheader("💪 Physical Activity Log")
     if st.session_state.activity_log:
-        activity_df = pd.DataFrame(st.session_state.activity_log)
-        activity_df["time"] = pd.to_datetime(activity_df["time"])
-        activity_df = activity_df[["date", "energy", "activity", "duration", "calories"]].sort_values(by="date", ascending=False)
+        activity_df = pd.DataFrame(st.session_state.activity_log).sort_values(by="time", ascending=False)
+        activity_df["date"] = pd.to_datetime(to_local_ms(activity_df["time"], st.session_state.timezone), unit="ms").dt.date
+        activity_df = activity_df[["date", "energy", "activity", "duration", "calories"]]
 
         # Display table with formatted headers
         st.dataframe(activity_df.rename(columns={
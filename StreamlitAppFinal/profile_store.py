@@ -0,0 +1,207 @@
+import atexit
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+# --- PROFILE & LOG STORE ---
+# Keeps each user's profile and logs outside st.session_state, so a refresh
+# doesn't lose them and every session served by the process shares one store.
+# Backends implement the same four methods; SQLiteBackend is the first one, and
+# CachedStore puts an in-memory read-through cache for profiles in front of any backend.
+
+PROFILE_FIELDS = ["gender", "weight", "height", "age", "goal", "activity", "timezone"]
+
+logger = logging.getLogger(__name__)
+
+
+class StoreBackend:
+    def load_profile(self, user_id):
+        raise NotImplementedError
+
+    def save_profile(self, user_id, profile):
+        raise NotImplementedError
+
+    def append_logs(self, user_id, kind, entries):
+        raise NotImplementedError
+
+    def load_logs(self, user_id, kind):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+# A fixed set of SQLite connections handed out to whichever thread needs one
+class ConnectionPool:
+    def __init__(self, path, size=4, timeout=5.0):
+        self.path = path
+        self.timeout = timeout
+        self._pool = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._pool.put(self._connect())
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False, isolation_level=None)
+        # WAL lets readers keep going while a writer commits; NORMAL sync is safe in WAL mode
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        conn = self._pool.get(timeout=self.timeout)
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def close(self):
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+
+class SQLiteBackend(StoreBackend):
+    def __init__(self, path="thrivehub.db", pool_size=4, batch_size=50, flush_interval=2.0, timeout=5.0):
+        self.pool = ConnectionPool(path, size=pool_size, timeout=timeout)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._closed = threading.Event()
+        with self.pool.connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS profiles (
+                    user_id TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    updated_at INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS logs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    time INTEGER NOT NULL,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS logs_user_kind_time ON logs (user_id, kind, time);
+            """)
+
+        # Background flusher: every buffered entry reaches the database within flush_interval seconds
+        self._flusher = threading.Thread(target=self._flush_periodically, name="thrivehub-flusher", daemon=True)
+        self._flusher.start()
+
+    # A failed flush keeps its rows buffered, so the flusher logs the error and retries on the next tick
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Flushing buffered log entries failed; retrying in %s s", self.flush_interval)
+
+    def load_profile(self, user_id):
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT data FROM profiles WHERE user_id = ?", (user_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_profile(self, user_id, profile):
+        with self.pool.connection() as conn:
+            conn.execute(
+                "INSERT INTO profiles (user_id, data, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(user_id) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                (user_id, json.dumps(profile), time.time_ns() // 1_000_000),
+            )
+
+    # Log entries are buffered and written in batches: one transaction per batch instead of one per entry.
+    # A full batch is written straight away; anything smaller is picked up by the background flusher.
+    def append_logs(self, user_id, kind, entries):
+        rows = [(user_id, kind, int(entry["time"]), json.dumps(entry)) for entry in entries]
+        with self._pending_lock:
+            self._pending.extend(rows)
+            due = len(self._pending) >= self.batch_size
+        if due:
+            self.flush()
+
+    # Flushes run one at a time, so once flush() returns every entry appended before it is committed.
+    # Rows leave the buffer only after COMMIT; if the write fails they stay buffered for the next flush.
+    def flush(self):
+        with self._flush_lock:
+            with self._pending_lock:
+                rows = list(self._pending)
+            if not rows:
+                return
+            with self.pool.connection() as conn:
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    conn.executemany("INSERT INTO logs (user_id, kind, time, data) VALUES (?, ?, ?, ?)", rows)
+                    conn.execute("COMMIT")
+                except Exception:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    raise
+            # Appends only add to the end and flushes don't overlap, so the written rows are still the first ones
+            with self._pending_lock:
+                del self._pending[:len(rows)]
+
+    # Pending writes are flushed first, so a user always reads back what they just logged
+    def load_logs(self, user_id, kind):
+        self.flush()
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT data FROM logs WHERE user_id = ? AND kind = ? ORDER BY time, id", (user_id, kind)
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def close(self):
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._flusher.join()
+        self.flush()
+        self.pool.close()
+
+
+# Read-through cache: profiles are served from memory after the first load
+class CachedStore:
+    def __init__(self, backend):
+        self.backend = backend
+        self._profiles = {}
+        self._lock = threading.Lock()
+
+    def load_profile(self, user_id):
+        with self._lock:
+            if user_id in self._profiles:
+                return self._profiles[user_id]
+        profile = self.backend.load_profile(user_id)
+        with self._lock:
+            self._profiles[user_id] = profile
+        return profile
+
+    # Writes go through to the backend, and only when something actually changed
+    def save_profile(self, user_id, profile):
+        profile = {field: profile.get(field) for field in PROFILE_FIELDS}
+        if self.load_profile(user_id) == profile:
+            return
+        self.backend.save_profile(user_id, profile)
+        with self._lock:
+            self._profiles[user_id] = profile
+
+    def append_log(self, user_id, kind, entry):
+        self.backend.append_logs(user_id, kind, [entry])
+
+    def load_logs(self, user_id, kind):
+        return self.backend.load_logs(user_id, kind)
+
+    def close(self):
+        self.backend.close()
+
+
+# Open the default store: SQLite in WAL mode behind a read-through cache, flushed on exit
+def open_store(path="thrivehub.db", **options):
+    store = CachedStore(SQLiteBackend(path, **options))
+    atexit.register(store.close)
+    return store
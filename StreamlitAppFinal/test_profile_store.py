@@ -0,0 +1,114 @@
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+import pytest
+
+from profile_store import PROFILE_FIELDS, CachedStore, SQLiteBackend
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "thrivehub.db")
+
+
+@pytest.fixture
+def store(db_path):
+    # A long flush interval keeps the background flusher out of the way
+    store = CachedStore(SQLiteBackend(db_path, batch_size=50, flush_interval=60))
+    yield store
+    store.close()
+
+
+def test_profile_round_trip_and_cache_hits(store):
+    assert store.load_profile("alice") is None
+
+    store.save_profile("alice", {"gender": "Female", "weight": 60.0, "age": 30})
+    expected = {field: None for field in PROFILE_FIELDS}
+    expected.update({"gender": "Female", "weight": 60.0, "age": 30})
+    assert store.load_profile("alice") == expected
+
+    # Later loads come from the cache and never reach the backend
+    def fail(user_id):
+        raise AssertionError("profile load went to the backend")
+
+    store.backend.load_profile = fail
+    assert store.load_profile("alice") == expected
+
+
+def count_logs(db_path):
+    with closing(sqlite3.connect(db_path)) as conn:
+        return conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0]
+
+
+def test_unflushed_append_is_visible_to_load_logs(store, db_path):
+    entry = {"time": 1_700_000_000_000, "mood": "Happy", "energy": 80}
+    store.append_log("alice", "mood", entry)
+
+    # One entry is far below the batch size, so another connection can't see it until a flush
+    assert count_logs(db_path) == 0
+    store.backend.flush()
+    assert count_logs(db_path) == 1
+
+    store.append_log("alice", "mood", {**entry, "time": entry["time"] + 1})
+    assert count_logs(db_path) == 1
+    assert [logged["time"] for logged in store.load_logs("alice", "mood")] == [entry["time"], entry["time"] + 1]
+    assert store.load_logs("alice", "activity") == []
+
+
+def test_entries_survive_a_lock_timeout(db_path):
+    store = CachedStore(SQLiteBackend(db_path, flush_interval=0.05, timeout=0.1))
+    blocker = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        # Another connection holds the write lock, so flushing times out
+        blocker.execute("BEGIN IMMEDIATE")
+        store.append_log("alice", "mood", {"time": 1, "mood": "Anxious", "energy": 10})
+        with pytest.raises(sqlite3.OperationalError):
+            store.backend.flush()
+        time.sleep(0.3)
+
+        # Once the lock is released, the background flusher is still running and writes the entry
+        blocker.execute("ROLLBACK")
+        deadline = time.monotonic() + 2
+        while count_logs(db_path) == 0 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert count_logs(db_path) == 1
+        assert store.load_logs("alice", "mood") == [{"time": 1, "mood": "Anxious", "energy": 10}]
+    finally:
+        blocker.close()
+        store.close()
+
+
+def test_concurrent_appends(store):
+    users, per_thread = ["alice", "bob", "carol", "dan"], 200
+
+    def write(user_id, offset):
+        for i in range(per_thread):
+            store.append_log(user_id, "activity", {"time": offset + i, "energy": i % 100})
+
+    threads = [threading.Thread(target=write, args=(user_id, n * per_thread)) for n in range(2) for user_id in users]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for user_id in users:
+        logs = store.load_logs(user_id, "activity")
+        assert len(logs) == 2 * per_thread
+        assert [entry["time"] for entry in logs] == list(range(2 * per_thread))
+
+
+def test_reopen_reads_back_same_data(db_path):
+    first = CachedStore(SQLiteBackend(db_path, flush_interval=60))
+    first.save_profile("alice", {"goal": "Muscle Gain", "timezone": "Asia/Seoul"})
+    first.append_log("alice", "mood", {"time": 1, "mood": "Tired", "energy": 20})
+    first.close()
+
+    second = CachedStore(SQLiteBackend(db_path, flush_interval=60))
+    try:
+        assert second.load_profile("alice")["goal"] == "Muscle Gain"
+        assert second.load_profile("alice")["timezone"] == "Asia/Seoul"
+        assert second.load_logs("alice", "mood") == [{"time": 1, "mood": "Tired", "energy": 20}]
+    finally:
+        second.close()
@@ -0,0 +1,65 @@
+import os
+
+import streamlit as st
+import pandas as pd
+
+from medal_cube import file_hash, load_cube
+
+DATA_PATH = "data/olympics_08_medalists.csv"
+
+st.set_page_config(page_title="Olympics 2008 Medal Explorer", layout="wide")
+st.title("🥇 Olympics 2008 Medal Explorer")
+st.write("Explore the 2008 Beijing Olympics medal counts by sport, gender and medal type. All counts come from a precomputed sport × gender × medal cube, so filters are answered instantly.")
+
+
+# --- LOAD CUBE ---
+# The cache is keyed on the CSV's modification time and size, which a rerun can check without reading the file.
+# The file is hashed only when those change, and that hash picks the Parquet cache entry.
+@st.cache_resource
+def get_cube(path, mtime_ns, size):
+    return load_cube(path, source_hash=file_hash(path))
+
+
+stat = os.stat(DATA_PATH)
+cube = get_cube(DATA_PATH, stat.st_mtime_ns, stat.st_size)
+
+# --- FILTERS ---
+with st.sidebar:
+    st.subheader("🔍 Filters")
+    sports = st.multiselect("Sport", list(cube.sports), default=list(cube.sports))
+    genders = st.multiselect("Gender", list(cube.genders), default=list(cube.genders))
+    medals = st.multiselect("Medal", list(cube.medals), default=list(cube.medals))
+
+selected = cube.select(sports, genders, medals)
+
+if selected.size == 0:
+    st.info("Select at least one sport, gender and medal to see results.")
+    st.stop()
+
+# --- SUMMARY ---
+col1, col2, col3 = st.columns(3)
+col1.metric("Total Medals", int(selected.sum()))
+col2.metric("Sports", len(sports))
+gold = selected[:, :, medals.index("gold")].sum() if "gold" in medals else 0
+col3.metric("Gold Share", f"{gold / max(selected.sum(), 1):.0%}")
+
+# --- MEDALS BY SPORT ---
+st.subheader("🏅 Medals by Sport")
+# A slider needs min < max, so it only appears when more than one sport is selected
+top_n = st.slider("Number of sports to show", 1, len(sports), min(10, len(sports))) if len(sports) > 1 else len(sports)
+by_sport = pd.Series(selected.sum(axis=(1, 2)), index=sports, name="Total Medals")
+st.bar_chart(by_sport.sort_values(ascending=False).head(top_n))
+
+# --- MEDALS BY GENDER ---
+col4, col5 = st.columns(2)
+with col4:
+    st.subheader("🚻 Medals by Gender")
+    st.bar_chart(pd.Series(selected.sum(axis=(0, 2)), index=genders, name="Total Medals"))
+with col5:
+    st.subheader("🥉 Medals by Type")
+    st.bar_chart(pd.Series(selected.sum(axis=(0, 1)), index=medals, name="Total Medals"))
+
+# --- PIVOT TABLE ---
+st.subheader("📋 Medals per Sport and Gender")
+pivot = pd.DataFrame(selected.sum(axis=2), index=pd.Index(sports, name="sport"), columns=pd.Index(genders, name="gender"))
+st.dataframe(pivot.sort_values(by=genders, ascending=False), use_container_width=True)
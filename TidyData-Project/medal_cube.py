@@ -0,0 +1,101 @@
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from tidy_medals import load_medals_long
+
+# --- MEDAL CUBE ---
+# Every summary in the notebook is a count over some mix of sport, gender and
+# medal. We count all three at once into a small sport x gender x medal array,
+# so each summary becomes a slice of the cube instead of another scan of df_long.
+
+CACHE_DIR = Path(__file__).parent / "cache"
+AXES = ("sport", "gender", "medal")
+
+
+class MedalCube:
+    def __init__(self, counts, sports, genders, medals):
+        self.counts = counts
+        self.sports = pd.CategoricalIndex(sports, categories=sports, name="sport")
+        self.genders = pd.CategoricalIndex(genders, categories=genders, name="gender")
+        self.medals = pd.CategoricalIndex(medals, categories=medals, name="medal")
+
+    # Build the cube from a tidy frame with categorical sport/gender/medal columns
+    @classmethod
+    def from_long(cls, df_long):
+        sport = df_long["sport"].astype("category").cat
+        gender = df_long["gender"].astype("category").cat
+        medal = df_long["medal"].astype("category").cat
+        shape = (len(sport.categories), len(gender.categories), len(medal.categories))
+
+        # One pass: turn each (sport, gender, medal) triple into a flat cell number and count them
+        flat = np.ravel_multi_index((sport.codes, gender.codes, medal.codes), shape)
+        counts = np.bincount(flat, minlength=int(np.prod(shape))).reshape(shape)
+        return cls(counts, list(sport.categories), list(gender.categories), list(medal.categories))
+
+    # Positions along one axis for the selected labels (None keeps the whole axis)
+    def _positions(self, axis, labels):
+        index = getattr(self, axis + "s")
+        if labels is None:
+            return np.arange(len(index))
+        labels = list(labels)
+        positions = index.get_indexer(labels)
+        if (positions == -1).any():
+            missing = [label for label, position in zip(labels, positions) if position == -1]
+            raise KeyError(f"Unknown {axis}: {missing}")
+        return positions
+
+    # Sub-cube for the chosen sports, genders and medals
+    def select(self, sports=None, genders=None, medals=None):
+        positions = [self._positions(axis, labels) for axis, labels in zip(AXES, (sports, genders, medals))]
+        return self.counts[np.ix_(*positions)]
+
+    # Total medals by gender
+    def gender_totals(self):
+        return pd.Series(self.counts.sum(axis=(0, 2)), index=self.genders.astype(str), name="count")
+
+    # Total medals by type
+    def medal_totals(self):
+        return pd.Series(self.counts.sum(axis=(0, 1)), index=self.medals.astype(str), name="count")
+
+    # Sports with the most medals
+    def top_sports(self, n=10):
+        totals = pd.Series(self.counts.sum(axis=(1, 2)), index=self.sports.astype(str), name="count")
+        return totals.sort_values(ascending=False, kind="stable").head(n)
+
+    # Medals per sport and gender, sorted like the notebook's pivot table
+    def pivot(self):
+        table = pd.DataFrame(self.counts.sum(axis=2), index=self.sports.astype(str), columns=self.genders.astype(str))
+        table.index.name, table.columns.name = "sport", "gender"
+        return table.sort_values(by=list(table.columns), ascending=False)
+
+
+# --- CACHING ---
+# Hash the source CSV so a cached tidy frame is reused only while the file is unchanged
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Load the tidy medal table, reading it from a Parquet cache keyed by the CSV hash when possible.
+# Pass source_hash if it is already known, so the file isn't hashed twice.
+def load_cached_long(path, cache_dir=CACHE_DIR, source_hash=None):
+    source_hash = source_hash or file_hash(path)
+    cache_path = Path(cache_dir) / f"medals_{source_hash[:16]}.parquet"
+    if cache_path.exists():
+        return pd.read_parquet(cache_path)
+
+    df_long = load_medals_long(path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    df_long.to_parquet(cache_path, index=False)
+    return df_long
+
+
+# Build the medal cube for a medalist CSV, going through the Parquet cache
+def load_cube(path, cache_dir=CACHE_DIR, source_hash=None):
+    return MedalCube.from_long(load_cached_long(path, cache_dir, source_hash))
@@ -0,0 +1,63 @@
+import csv
+import pandas as pd
+
+# --- WIDE-TO-LONG TRANSFORMER ---
+# The medalist CSV stores one "gender_sport" column per event, and almost every
+# cell is empty. Instead of melting every (row, column) pair and dropping the
+# empty ones afterwards, we stream the file row by row and only keep the cells
+# that actually hold a medal.
+
+MEDAL_ORDER = ["gold", "silver", "bronze"]
+
+
+# Split a "gender_sport" header into its two parts and clean the sport name
+def parse_header(column):
+    gender, sport = column.split("_", 1)
+    return gender, sport.replace("_", " ").title()
+
+
+# Build a lookup from value to categorical code, keeping first-seen order
+def _codes_for(values):
+    codes = {}
+    for value in values:
+        codes.setdefault(value, len(codes))
+    return codes
+
+
+# Read the wide medalist CSV and return a tidy DataFrame with one row per medal
+def load_medals_long(path, id_column="medalist_name"):
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        id_index = header.index(id_column)
+
+        # Parse every event header once, not once per row
+        value_columns = [i for i in range(len(header)) if i != id_index]
+        parsed = [parse_header(header[i]) for i in value_columns]
+        gender_codes = _codes_for(gender for gender, _ in parsed)
+        sport_codes = _codes_for(sport for _, sport in parsed)
+        column_codes = [(i, gender_codes[gender], sport_codes[sport]) for i, (gender, sport) in zip(value_columns, parsed)]
+        medal_codes = {medal: code for code, medal in enumerate(MEDAL_ORDER)}
+
+        names, sports, genders, medals = [], [], [], []
+        for row in reader:
+            for i, gender_code, sport_code in column_codes:
+                if i >= len(row):
+                    break
+                medal = row[i].strip()
+                if not medal:
+                    continue
+                if medal not in medal_codes:
+                    medal_codes[medal] = len(medal_codes)
+                names.append(row[id_index])
+                sports.append(sport_code)
+                genders.append(gender_code)
+                medals.append(medal_codes[medal])
+
+    # Build categorical columns straight from the integer codes
+    return pd.DataFrame({
+        "medalist_name": names,
+        "sport": pd.Categorical.from_codes(sports, categories=list(sport_codes)),
+        "gender": pd.Categorical.from_codes(genders, categories=list(gender_codes)),
+        "medal": pd.Categorical.from_codes(medals, categories=list(medal_codes)),
+    })
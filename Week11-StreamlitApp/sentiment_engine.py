@@ -0,0 +1,169 @@
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+# --- LEXICON ENGINE ---
+# Compiles the sentiment lexicon once into an Aho-Corasick automaton over word
+# tokens, so single words and multi-word phrases are all found in one pass over
+# the text. A negator ("not", "never", ...) shortly before a match flips its score,
+# but only within the same clause and only for the first match after it.
+
+DEFAULT_LEXICON = {
+    "good": 1, "great": 2, "excellent": 3,
+    "bad": -2, "poor": -3, "terrible": -5,
+    "highly recommend": 3, "waste of money": -4, "fell apart": -3,
+}
+NEGATORS = {"not", "no", "never", "don't", "doesn't", "didn't", "isn't", "wasn't", "aren't", "won't", "can't", "hardly"}
+NEGATION_WINDOW = 3
+CLAUSE_BOUNDARIES = set(".,;!?")
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?|[.,;!?]")
+
+
+# Lowercase word tokens plus clause boundaries (.,;!?); other punctuation is dropped, so "great!" matches "great"
+def tokenize(text):
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+class LexiconEngine:
+    def __init__(self, lexicon=None, negators=None, negation_window=NEGATION_WINDOW):
+        self.lexicon = dict(DEFAULT_LEXICON if lexicon is None else lexicon)
+        self.negators = set(NEGATORS if negators is None else negators)
+        self.negation_window = negation_window
+        # Integer weights give integer scores; any fractional weight makes scores float
+        self.score_dtype = "int64" if all(isinstance(weight, int) for weight in self.lexicon.values()) else "float64"
+        self._build_automaton()
+
+    # Trie of token sequences plus failure links (Aho-Corasick)
+    def _build_automaton(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for phrase, score in self.lexicon.items():
+            tokens = [token for token in tokenize(phrase) if token not in CLAUSE_BOUNDARIES]
+            if not tokens:
+                continue
+            state = 0
+            for token in tokens:
+                if token not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][token] = len(self._goto) - 1
+                state = self._goto[state][token]
+            self._output[state].append((len(tokens), score))
+
+        # Breadth-first pass to link each state to its longest proper suffix in the trie
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(token, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    # All lexicon matches in a token list as (start, end, score)
+    def _matches(self, tokens):
+        state = 0
+        for end, token in enumerate(tokens, start=1):
+            while state and token not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(token, 0)
+            for length, score in self._output[state]:
+                yield end - length, end, score
+
+    # Whether a negator sits in the few tokens before start. The look-back stops at a clause
+    # boundary and at the end of the previous match, so a negator flips at most one match.
+    def _negated(self, tokens, start, previous_end):
+        for position in range(start - 1, max(previous_end, start - self.negation_window) - 1, -1):
+            if tokens[position] in CLAUSE_BOUNDARIES:
+                return False
+            if tokens[position] in self.negators:
+                return True
+        return False
+
+    # Sentiment score of one text: longest non-overlapping matches, negated when a negator precedes them
+    def score(self, text):
+        tokens = tokenize(text)
+        matches = sorted(self._matches(tokens), key=lambda match: (match[0], match[0] - match[1]))
+        total, covered_until = 0, 0
+        for start, end, score in matches:
+            if start < covered_until:
+                continue
+            total += -score if self._negated(tokens, start, covered_until) else score
+            covered_until = end
+        return total
+
+    @staticmethod
+    def label_for(score):
+        return "positive" if score > 0 else "negative"
+
+    def label(self, text):
+        return self.label_for(self.score(text))
+
+    # Scores for an iterator of texts, produced lazily
+    def score_iter(self, texts):
+        for text in texts:
+            yield self.score(text)
+
+    # Scores and labels for a whole pandas Series
+    def score_series(self, texts):
+        scores = pd.Series(list(self.score_iter(texts.fillna(""))), index=texts.index, name="score", dtype=self.score_dtype)
+        labels = pd.Series(pd.Categorical((scores > 0).map({True: "positive", False: "negative"}),
+                                          categories=["negative", "positive"]), index=texts.index, name="sentiment")
+        return pd.concat([scores, labels], axis=1)
+
+
+# --- FILE SCORING ---
+# Worker processes build their own engine once and then score chunks of texts.
+_worker_engine = None
+
+
+def _init_worker(lexicon):
+    global _worker_engine
+    _worker_engine = LexiconEngine(lexicon)
+
+
+def _score_chunk(chunk, text_column):
+    scored = _worker_engine.score_series(chunk[text_column].astype("string"))
+    return pd.concat([chunk, scored], axis=1)
+
+
+# Read a CSV or JSONL file in chunks; only .jsonl files are read as JSON lines
+def read_chunks(path, chunksize, file_format=None):
+    file_format = file_format or ("jsonl" if str(path).endswith(".jsonl") else "csv")
+    if file_format == "jsonl":
+        return pd.read_json(path, lines=True, chunksize=chunksize)
+    return pd.read_csv(path, chunksize=chunksize)
+
+
+# Score every row of a CSV/JSONL file and write the results as CSV.
+# At most `workers * 2` chunks are in flight, so memory stays bounded however large the file is.
+def score_file(input_path, output_path, text_column="text", lexicon=None, chunksize=10_000, workers=None, file_format=None):
+    workers = workers or os.cpu_count() or 1
+    rows_written = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(lexicon,)) as pool, \
+            open(output_path, "w", newline="", encoding="utf-8") as out:
+        pending = deque()
+
+        def write_next():
+            nonlocal rows_written
+            scored = pending.popleft().result()
+            scored.to_csv(out, header=rows_written == 0, index=False)
+            rows_written += len(scored)
+
+        for chunk in read_chunks(input_path, chunksize, file_format):
+            if text_column not in chunk.columns:
+                raise ValueError(f"Input must contain a '{text_column}' column")
+            pending.append(pool.submit(_score_chunk, chunk, text_column))
+            if len(pending) >= workers * 2:
+                write_next()
+        while pending:
+            write_next()
+    return rows_written
+
@@ -1,17 +1,52 @@
+import os
+import tempfile
+
 import streamlit as st
 
+from sentiment_engine import LexiconEngine, score_file
+
+
+# Build the lexicon engine once per server process instead of on every rerun
+@st.cache_resource
+def get_engine():
+    return LexiconEngine()
+
+
 # Sentiment functions
 def rule_based_sentiment(text):
-    lexicon = {
-        "good": 1, "great": 2, "excellent": 3,
-        "bad": -2, "poor": -3, "terrible": -5
-    }
-    score = sum([lexicon.get(word, 0) for word in text.lower().split()])
-    return "positive" if score > 0 else "negative"
+    return get_engine().label(text)
+
 
 # Streamlit interface
 st.title("🎯 Sentiment Analyzer")
-text = st.text_area("Enter your review:")
+mode = st.radio("Mode:", ["Single Review", "Upload File"], horizontal=True)
+
+if mode == "Single Review":
+    text = st.text_area("Enter your review:")
+
+    # Score once and derive the label from that score
+    score = get_engine().score(text)
+    result = LexiconEngine.label_for(score)
+    st.write(f"🧠 Sentiment: **{result.upper()}** (score {score})")
+
+else:
+    uploaded_file = st.file_uploader("Upload a CSV or JSONL file of reviews", type=["csv", "jsonl"])
+    text_column = st.text_input("Column containing the review text:", "text")
+
+    if uploaded_file and st.button("Score Reviews"):
+        suffix = os.path.splitext(uploaded_file.name)[1]
+        with tempfile.TemporaryDirectory() as workdir:
+            input_path = os.path.join(workdir, "reviews" + suffix)
+            output_path = os.path.join(workdir, "scored.csv")
+            with open(input_path, "wb") as f:
+                f.write(uploaded_file.getbuffer())
 
-result = rule_based_sentiment(text)
-st.write(f"🧠 Sentiment: **{result.upper()}**")
\ No newline at end of file
+            try:
+                with st.spinner("Scoring reviews..."):
+                    rows = score_file(input_path, output_path, text_column=text_column)
+            except ValueError as error:
+                st.error(str(error))
+            else:
+                st.success(f"Scored {rows} reviews.")
+                with open(output_path, "rb") as f:
+                    st.download_button("⬇️ Download scores", f.read(), file_name="scored_reviews.csv", mime="text/csv")
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+# --- FILTER ENGINE ---
+# Precomputes a packed bitmap (one bit per row) for every value of each
+# categorical column and a sorted index for each numeric column. A query ANDs
+# the bitmaps together instead of re-scanning the frame with boolean masks, so
+# it stays fast as the catalog grows to millions of rows.
+
+MISSING = "(missing)"
+
+
+class FilterEngine:
+    def __init__(self, df, categorical_columns, numeric_columns):
+        self.df = df.reset_index(drop=True)
+        self.n_rows = len(self.df)
+        self._all_rows = self._pack(np.ones(self.n_rows, dtype=bool))
+
+        # Bitmap per categorical value: {column: {value: packed bits}}.
+        # Missing values get their own MISSING bitmap so those rows can still be selected.
+        self.bitmaps = {}
+        for column in categorical_columns:
+            values = pd.Categorical(self.df[column])
+            self.bitmaps[column] = {
+                value: self._pack(values.codes == code) for code, value in enumerate(values.categories)
+            }
+            if (values.codes == -1).any():
+                self.bitmaps[column][MISSING] = self._pack(values.codes == -1)
+
+        # Range index per numeric column: sorted values plus the rows they came from (missing values left out)
+        self.range_indexes = {}
+        for column in numeric_columns:
+            values = self.df[column].to_numpy(dtype="float64")
+            rows = np.flatnonzero(~np.isnan(values))
+            order = rows[np.argsort(values[rows], kind="stable")]
+            self.range_indexes[column] = (values[order], order)
+
+    @staticmethod
+    def _pack(mask):
+        return np.packbits(mask)
+
+    def _unpack(self, bits):
+        return np.unpackbits(bits, count=self.n_rows).view(bool)
+
+    # Values available for a categorical filter
+    def options(self, column):
+        return list(self.bitmaps[column])
+
+    # Smallest and largest value of a numeric column
+    def bounds(self, column):
+        values, _ = self.range_indexes[column]
+        return (values[0], values[-1]) if len(values) else (np.nan, np.nan)
+
+    # Rows whose value is any of the selected ones (OR within a column)
+    def _category_bits(self, column, selected):
+        bits = np.zeros_like(self._all_rows)
+        for value in selected:
+            if value in self.bitmaps[column]:
+                bits |= self.bitmaps[column][value]
+        return bits
+
+    # Rows with low <= value <= high, found with two binary searches on the sorted index
+    def _range_bits(self, column, low, high):
+        values, order = self.range_indexes[column]
+        start = np.searchsorted(values, low, side="left")
+        end = np.searchsorted(values, high, side="right")
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[order[start:end]] = True
+        return self._pack(mask)
+
+    # Combine every filter with bitwise AND and return the matching row positions
+    def query(self, categories=None, ranges=None):
+        bits = self._all_rows.copy()
+        for column, selected in (categories or {}).items():
+            bits &= self._category_bits(column, selected)
+        for column, (low, high) in (ranges or {}).items():
+            bits &= self._range_bits(column, low, high)
+        return np.flatnonzero(self._unpack(bits))
+
+    # One page of matching rows, so the app never sends the whole frame to the browser
+    def page(self, rows, page_number, page_size=25):
+        start = (page_number - 1) * page_size
+        return self.df.iloc[rows[start:start + page_size]]
+
+
+# Number of pages needed to show n_rows
+def page_count(n_rows, page_size=25):
+    return max(1, -(-n_rows // page_size))
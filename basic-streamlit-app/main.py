@@ -1,25 +1,58 @@
 import streamlit as st
 import pandas as pd
 
+from filter_engine import FilterEngine, page_count
+
 st.title("Penguins!")
 st.write("This Streamlit app allows users to retrieve data about penguins that inhabit in different islands. The data contains information about the penguins' ID number, Species type, Located Island, Physical measurements, Sex, and Birth Year.")
 
-# Loading data
-df = pd.read_csv("data/penguins.csv")
+CATEGORICAL_COLUMNS = ["island", "species", "sex", "year"]
+NUMERIC_COLUMNS = ["bill_length_mm", "bill_depth_mm", "flipper_length_mm", "body_mass_g"]
+PAGE_SIZE = 25
+
+
+# Loading data once per server process instead of on every rerun
+@st.cache_data
+def load_data(path):
+    return pd.read_csv(path)
+
+
+# Building the filter indexes once for the loaded data
+@st.cache_resource
+def load_engine(path):
+    return FilterEngine(load_data(path), CATEGORICAL_COLUMNS, NUMERIC_COLUMNS)
+
+
+engine = load_engine("data/penguins.csv")
 
-# Display the imported dataset
-st.write("Here's the dataset loaded from a CSV file:")
-st.dataframe(df)
+# Asking the user for filters
+st.sidebar.header("🔍 Filter Penguins")
+st.sidebar.write("Choose any combination of filters; only penguins matching all of them are shown.")
 
-# Asking the user for an input
-st.write("Please select an island of your preference below to view penguins' data filtered by location:")
+categories = {}
+for column in CATEGORICAL_COLUMNS:
+    options = engine.options(column)
+    selected = st.sidebar.multiselect(f"Select {column}", options, default=options)
+    if len(selected) < len(options):
+        categories[column] = selected
 
-# Using a selectbox to allow users to filter data by island
-island = st.selectbox("Select an island", df["island"].unique())
+ranges = {}
+for column in NUMERIC_COLUMNS:
+    low, high = (float(value) for value in engine.bounds(column))
+    selected = st.sidebar.slider(column.replace("_", " ").title(), low, high, (low, high))
+    # Only filter when the range is narrowed, so penguins with missing measurements stay visible by default
+    if selected != (low, high):
+        ranges[column] = selected
 
-# Filtering the DataFrame based on user selection
-filtered_df = df[df["island"] == island]
+# Filtering the data with the precomputed indexes
+rows = engine.query(categories, ranges)
 
-# Display the filtered results
-st.write(f"Penguins in {island}:")
-st.dataframe(filtered_df)
\ No newline at end of file
+# Display the filtered results one page at a time
+st.write(f"Showing **{len(rows)}** of {engine.n_rows} penguins:")
+if len(rows):
+    pages = page_count(len(rows), PAGE_SIZE)
+    page_number = st.number_input("Page", min_value=1, max_value=pages, value=1) if pages > 1 else 1
+    st.dataframe(engine.page(rows, page_number, PAGE_SIZE), hide_index=True)
+    st.caption(f"Page {page_number} of {pages}")
+else:
+    st.info("No penguins match these filters.")